@@ -2,8 +2,10 @@
 This module is used to set up and manipulate the ``logging`` configuration for
 utilities like debug mode.
 """
+import copy
 import logging
 import logging.config
+import mmap
 import os
 import time
 from contextlib import contextmanager
@@ -14,9 +16,19 @@ import yaml
 
 from .constants import FILE_YAML, NO_LOG_EXCEPTIONS
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
 logger = logging.getLogger(__name__)
 central_logger = pcdsutils.log.logger
 
+# Parsed logging config, keyed by (path, mtime) so edits are picked up
+_YAML_CACHE = {}
+# Last console handler found by get_console_handler
+_console_handler = None
+
 
 def setup_logging(dir_logs=None):
     """
@@ -32,8 +44,15 @@ def setup_logging(dir_logs=None):
     dir_logs: ``str`` or ``Path``, optional
         Path to the log directory. If omitted, we won't use a log file.
     """
-    with open(FILE_YAML, 'rt') as f:
-        config = yaml.safe_load(f.read())
+    global _console_handler
+    key = (FILE_YAML, os.stat(FILE_YAML).st_mtime)
+    if key not in _YAML_CACHE:
+        # Let the parser read straight from the mapped file
+        with open(FILE_YAML, 'rb') as f, \
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            _YAML_CACHE[key] = yaml.load(mm, Loader=SafeLoader)
+    # We modify the config below, so never hand out the cached copy
+    config = copy.deepcopy(_YAML_CACHE[key])
 
     if dir_logs is None:
         # Remove debug file from the config
@@ -43,21 +62,30 @@ def setup_logging(dir_logs=None):
         # Ensure Path object
         dir_logs = Path(dir_logs)
 
+        # Use one timestamp so the month and file name always agree
+        now = time.localtime()
+
         # Subdirectory for year/month
-        dir_month = dir_logs / time.strftime('%Y_%m')
+        dir_month = dir_logs / time.strftime('%Y_%m', now)
 
         # Make the log directories if they don't exist
         # Make sure each level is all permissions
-        for directory in (dir_logs, dir_month):
-            if not directory.exists():
+        # Try the month first, usually the log directory is already there
+        try:
+            dir_month.mkdir()
+        except FileExistsError:
+            pass
+        except FileNotFoundError:
+            for directory in (dir_logs, dir_month):
                 directory.mkdir()
                 directory.chmod(0o777)
+        else:
+            dir_month.chmod(0o777)
 
         user = os.environ['USER']
-        timestamp = time.strftime('%d_%Hh%Mm%Ss')
+        timestamp = time.strftime('%d_%Hh%Mm%Ss', now)
         log_file = '{}_{}.{}'.format(user, timestamp, 'log')
         path_log_file = dir_month / log_file
-        path_log_file.touch()
         config['handlers']['debug']['filename'] = str(path_log_file)
 
     # Configure centralized PCDS logging:
@@ -65,6 +93,8 @@ def setup_logging(dir_logs=None):
     central_logger.propagate = False
 
     logging.config.dictConfig(config)
+    # dictConfig replaced the root handlers, drop the stale console handler
+    _console_handler = None
     noisy_loggers = ['parso', 'pyPDB.dbd.yacc', 'ophyd', 'bluesky']
     hush_noisy_loggers(noisy_loggers)
 
@@ -99,10 +129,11 @@ def get_session_logfiles():
         logger.warning("No debug RotatingFileHandler configured for session")
         return list()
     # Find all the log files that were generated by this session
-    base = Path(handler.baseFilename)
-    return [str(base.parent / log)
-            for log in os.listdir(base.parent)
-            if log.startswith(base.name)]
+    # Rotated files appear as we go, so list the directory fresh each time
+    log_dir, base_name = os.path.split(handler.baseFilename)
+    return [os.path.join(log_dir, log)
+            for log in os.listdir(log_dir)
+            if log.startswith(base_name)]
 
 
 def get_console_handler():
@@ -114,7 +145,15 @@ def get_console_handler():
     console: ``StreamHandler``
         The ``Handler`` that prints to the screen.
     """
-    return get_handler('console')
+    global _console_handler
+    handler = _console_handler
+    # Handlers can be swapped out from under us, so make sure the cached
+    # handler is still the root's console handler before reusing it
+    if (handler is None or handler.name != 'console'
+            or handler not in logging.getLogger('').handlers):
+        handler = get_handler('console')
+        _console_handler = handler
+    return handler
 
 
 def get_debug_handler():
@@ -212,9 +251,15 @@ def debug_context():
             buggy_function()
     """
     old_level = get_console_level()
-    debug_mode(True)
-    yield
-    set_console_level(level=old_level)
+    # Nothing to change or restore if we're already in debug mode
+    if old_level <= logging.DEBUG:
+        yield
+        return
+    set_console_level(level=logging.DEBUG)
+    try:
+        yield
+    finally:
+        set_console_level(level=old_level)
 
 
 def debug_wrapper(f, *args, **kwargs):
@@ -231,9 +276,19 @@ def debug_wrapper(f, *args, **kwargs):
 
     **kwargs:
         Function keyword arguments
+
+    Returns
+    -------
+    result:
+        Whatever ``f`` returns
     """
-    with debug_context():
-        f(*args, **kwargs)
+    # Same as debug_context, without the generator overhead on every call
+    old_level = get_console_level()
+    set_console_level(level=logging.DEBUG)
+    try:
+        return f(*args, **kwargs)
+    finally:
+        set_console_level(level=old_level)
 
 
 def log_exception_to_central_server(exc_info, *, context='exception',
@@ -6,8 +6,7 @@ import logging
 
 from ophyd import Device
 
-from .utils import (IterableNamespace, find_class, strip_prefix,
-                    extract_objs)
+from .utils import IterableNamespace, find_class, extract_objs
 
 logger = logging.getLogger(__name__)
 
@@ -84,17 +83,18 @@ def class_namespace(cls, scope=None):
             cache[device_cls] = attrs
             return attrs
 
+    # Pick the inclusion check once rather than for every object
+    if cls == 'function':
+        include = isfunction
+    else:
+        def include(obj):
+            return isinstance(obj, cls)
+    debug_on = logger.isEnabledFor(logging.DEBUG)
+
     for name, obj in scope_objs.items():
-        # Determine whether or not to include this object
-        include = False
-        if cls == 'function':
-            if isfunction(obj):
-                include = True
-        elif isinstance(obj, cls):
-            include = True
-
-        if include:
-            logger.debug('Adding %s to %s namespace', name, cls)
+        if include(obj):
+            if debug_on:
+                logger.debug('Adding %s to %s namespace', name, cls)
             setattr(class_space, name, obj)
 
         # Determine whether or not to include any subdevices
@@ -104,8 +104,9 @@ def class_namespace(cls, scope=None):
                 device = obj
                 for attr in attrs:
                     device = getattr(device, attr)
-                logger.debug('Adding %s to %s namespace',
-                             device.name, cls)
+                if debug_on:
+                    logger.debug('Adding %s to %s namespace',
+                                 device.name, cls)
                 setattr(class_space, device.name, device)
 
     return class_space
@@ -137,14 +138,14 @@ def tree_namespace(scope=None):
     for name, obj in scope_objs.items():
         logger.debug('Add %s to tree namespace', name)
         upper_space = tree_space
-        keys = name.split('_')[:-1]
-
-        if keys:
+        parts = name.split('_')
+        if len(parts) > 1:
+            # Force lowercase
+            keys = [part.lower() for part in parts[:-1]]
+            # Stripping each key as a prefix in turn leaves the last part
+            name = parts[-1]
             # Add key to existing namespace branch, create new if needed
             for key in keys:
-                name = strip_prefix(name, key)
-                # Force lowercase
-                key = key.lower()
                 if not hasattr(upper_space, key):
                     setattr(upper_space, key, IterableNamespace())
                 upper_space = getattr(upper_space, key)
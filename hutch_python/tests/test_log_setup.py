@@ -119,6 +119,26 @@ def test_debug_context(log_queue):
     assert_is_info(log_queue)
 
 
+def test_debug_context_nested(log_queue):
+    logger.debug('test_debug_context_nested')
+
+    setup_queue_console()
+
+    with debug_context():
+        with debug_context():
+            assert_is_debug(log_queue)
+        # Leaving the inner context must not end debug mode
+        assert_is_debug(log_queue)
+
+    assert_is_info(log_queue)
+
+    # The old level is restored even if the block raises
+    with pytest.raises(ZeroDivisionError):
+        with debug_context():
+            1/0
+    assert_is_info(log_queue)
+
+
 def test_debug_wrapper(log_queue):
     logger.debug('test_debug_wrapper')
 
@@ -128,3 +148,5 @@ def test_debug_wrapper(log_queue):
     debug_wrapper(assert_is_debug, log_queue)
 
     assert_is_info(log_queue)
+
+    assert debug_wrapper(lambda x, y=0: x + y, 1, y=2) == 3
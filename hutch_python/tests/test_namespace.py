@@ -72,3 +72,12 @@ def test_conflicting_name():
     scope = SimpleNamespace(hutch_stand=SimpleNamespace(dev=1),
                             hutch_stand_dev=2)
     tree_namespace(scope=scope)
+
+
+def test_tree_namespace_device_components():
+    logger.debug('test_tree_namespace_device_components')
+    # A device and one of its components both fit at xpp.mot.apples
+    device = NormalDevice(name='xpp_mot')
+    scope = SimpleNamespace(xpp_mot=device, xpp_mot_apples=device.apples)
+    namespaces = tree_namespace(scope=scope)
+    assert namespaces.xpp.mot is device
@@ -1,4 +1,5 @@
 import logging
+import sys
 
 import pytest
 
@@ -60,6 +61,13 @@ def test_extract_objs():
     # Has an __all__ keyword
     objs = utils.extract_objs('sample_module_2.py')
     assert objs == dict(just_this=5.0)
+    # Only the .py suffix is removed, not trailing p's and y's
+    objs = utils.extract_objs('copy.py')
+    assert 'deepcopy' in objs
+    # Takes a module object
+    import sample_module_1
+    objs = utils.extract_objs(sample_module_1)
+    assert objs['hey'] == '4horses'
     # Takes a list
     objs = utils.extract_objs(['sample_module_1', 'sample_module_2'])
     assert len(objs) == 5
@@ -68,6 +76,14 @@ def test_extract_objs():
     assert objs['_TEST'] == 4
 
 
+def test_extract_objs_no_db(monkeypatch):
+    logger.debug('test_extract_objs_no_db')
+    # Before any LoadCache, there is no hutch_python.db to include
+    monkeypatch.delitem(sys.modules, 'hutch_python.db', raising=False)
+    objs = utils.extract_objs()
+    assert objs == {k: v for k, v in globals().items() if k[0] != '_'}
+
+
 def test_find_class():
     logger.debug('test_find_class')
     # Find some standard type that needs an import
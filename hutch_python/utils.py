@@ -3,11 +3,12 @@ Module that contains general-use utilities. Some of these are useful outside of
 ``hutch-python``, while others are used in multiple places throughout the
 module.
 """
+import builtins
 import logging
 import sys
 import time
 from contextlib import contextmanager
-from functools import partial
+from functools import lru_cache, partial
 from importlib import import_module
 from subprocess import check_output
 from types import SimpleNamespace
@@ -148,12 +149,13 @@ def extract_objs(scope=None, skip_hidden=True, stack_offset=0):
     if scope is None:
         stack_depth = 1 + stack_offset
         frame = sys._getframe(stack_depth)
-        try:
-            objs = extract_objs(scope='hutch_python.db',
-                                skip_hidden=skip_hidden,
-                                stack_offset=stack_offset)
-        except ImportError:
+        # hutch_python.db only exists once a LoadCache has spoofed it
+        db = sys.modules.get('hutch_python.db')
+        if db is None:
             objs = {}
+        else:
+            objs = extract_objs(scope=db, skip_hidden=skip_hidden,
+                                stack_offset=stack_offset)
         objs.update(frame.f_globals)
     else:
         if isinstance(scope, list):
@@ -166,15 +168,20 @@ def extract_objs(scope=None, skip_hidden=True, stack_offset=0):
             if isinstance(scope, str):
                 if scope.endswith('.py'):
                     scope = scope[:-3]
-                scope = import_module(scope)
-            objs = scope.__dict__.copy()
+                # Skip the import machinery for modules we already have
+                module = sys.modules.get(scope)
+                if module is None:
+                    module = import_module(scope)
+                scope = module
+            # Every branch below builds a new dict, no need to copy here
+            objs = scope.__dict__
 
     all_kwd = objs.get('__all__')
     if all_kwd is None:
         if skip_hidden:
             return {k: v for k, v in objs.items() if k[0] != '_'}
         else:
-            return objs
+            return objs.copy()
     else:
         all_objs = {}
         for kwd in all_kwd:
@@ -182,10 +189,14 @@ def extract_objs(scope=None, skip_hidden=True, stack_offset=0):
         return all_objs
 
 
+@lru_cache(maxsize=None)
 def find_object(obj_path):
     """
     Given a string module path to an object, return that object.
 
+    Results are cached. If the module is reloaded with ``importlib.reload``,
+    call ``find_object.cache_clear()`` to pick up the new object.
+
     Parameters
     ----------
     obj_path: ``str``
@@ -203,6 +214,7 @@ def find_object(obj_path):
     return getattr(module, class_name)
 
 
+@lru_cache(maxsize=None)
 def find_class(class_path, check_defaults=True):
     """
     Find a ``type`` object given a ``str``.
@@ -210,6 +222,12 @@ def find_class(class_path, check_defaults=True):
     Given a string class name, either return the matching built-in type or
     import the correct module and return the type.
 
+    Results are cached, so after an ``importlib.reload`` of a device module
+    this keeps returning the class from before the reload and `isinstance`
+    checks against newly created objects will fail. Call
+    ``find_class.cache_clear()`` and ``find_object.cache_clear()`` after
+    reloading to pick up the new classes.
+
     Parameters
     ----------
     class_path: ``str``
@@ -227,7 +245,10 @@ def find_class(class_path, check_defaults=True):
         if '.' in class_path:
             return find_object(class_path)
         else:
-            return eval(class_path)
+            try:
+                return vars(builtins)[class_path]
+            except KeyError:
+                raise NameError(class_path)
     except NameError:
         if check_defaults:
             for default in CLASS_SEARCH_PATH: